@@ -0,0 +1,59 @@
+"""Build optional cython modules."""
+
+import os
+from typing import Any
+
+from setuptools import Extension
+from setuptools.command.build_ext import build_ext
+
+COMPILER_DIRECTIVES = {
+    "language_level": "3",  # Python 3
+    # Keep Python semantics, e.g. int results for a factor of 1
+    "annotation_typing": False,
+}
+
+TO_CYTHONIZE = [
+    "src/bthome_ble/parser.py",
+]
+
+EXTENSIONS = [
+    Extension(
+        ext.removeprefix("src/").removesuffix(".py").replace("/", "."),
+        [ext],
+        language="c",
+        extra_compile_args=["-O3", "-g0"],
+    )
+    for ext in TO_CYTHONIZE
+]
+
+
+class BuildExt(build_ext):
+    def build_extensions(self) -> None:
+        try:
+            super().build_extensions()
+        except Exception:  # nosec
+            if os.environ.get("REQUIRE_CYTHON"):
+                raise
+
+
+def build(setup_kwargs: Any) -> None:
+    if os.environ.get("SKIP_CYTHON", False):
+        return
+    try:
+        from Cython.Build import cythonize
+
+        setup_kwargs.update(
+            dict(
+                ext_modules=cythonize(
+                    EXTENSIONS,
+                    compiler_directives=COMPILER_DIRECTIVES,
+                ),
+                cmdclass=dict(build_ext=BuildExt),
+            )
+        )
+        setup_kwargs["exclude_package_data"] = {
+            pkg: ["*.c"] for pkg in setup_kwargs["packages"]
+        }
+    except Exception:
+        if os.environ.get("REQUIRE_CYTHON"):
+            raise
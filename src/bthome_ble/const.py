@@ -13,6 +13,11 @@ from sensor_state_data import (
 from .event import EventDeviceKeys
 
 
+def decimal_places(factor: float) -> int:
+    """Return the number of decimal places to round a value with a factor to."""
+    return -int(f"{factor:e}".split("e")[-1])
+
+
 @dataclasses.dataclass
 class MeasTypes:
     meas_format: Union[
@@ -23,6 +28,11 @@ class MeasTypes:
     data_length: int = 1
     data_format: str = "unsigned_integer"
     factor: float = 1
+    decimals: int = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the number of decimal places for rounding."""
+        self.decimals = decimal_places(self.factor)
 
 
 class ExtendedSensorDeviceClass(BaseDeviceClass):
@@ -14,7 +14,8 @@ import logging
 import struct
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from operator import itemgetter
+from typing import Any, Callable, Union
 
 from bluetooth_data_tools import short_address
 from bluetooth_sensor_state_data import BluetoothData
@@ -26,11 +27,97 @@ from sensor_state_data.description import (
     BaseSensorDescription,
 )
 
-from .const import MEAS_TYPES
+from .const import MEAS_TYPES, decimal_places
 from .event import BUTTON_EVENTS, DIMMER_EVENTS, EventDeviceKeys
 
 _LOGGER = logging.getLogger(__name__)
 
+# Service data UUIDs of BTHome advertisements
+_SERVICE_UUID_V1 = "0000181c-0000-1000-8000-00805f9b34fb"
+_SERVICE_UUID_V1_ENCRYPTED = "0000181e-0000-1000-8000-00805f9b34fb"
+_SERVICE_UUID_V2 = "0000fcd2-0000-1000-8000-00805f9b34fb"
+
+# UUID16 and associated data used to build the AES-CCM nonce
+_BTHOME_V1_UUID = b"\x1e\x18"
+_BTHOME_V2_UUID = b"\xd2\xfc"
+_BTHOME_V1_ASSOCIATED_DATA = b"\x11"
+
+# BTHome V2 nonces also include the adv info byte after the UUID16
+_BTHOME_V2_UUIDS = tuple(_BTHOME_V2_UUID + bytes([adv_info]) for adv_info in range(256))
+
+# Separators to strip from an address to get its hex digits
+_ADDRESS_SEPARATORS = str.maketrans("", "", ":-")
+
+# Precompiled little-endian float formats for the supported data lengths
+_FLOAT_STRUCTS = {
+    2: struct.Struct("<e"),
+    4: struct.Struct("<f"),
+    8: struct.Struct("<d"),
+}
+
+# Data format codes, as used in the control byte of BTHome V1 objects
+_DATA_FORMATS = {
+    "unsigned_integer": 0,
+    "signed_integer": 1,
+    "float": 2,
+    "string": 3,
+    "raw": 4,
+    "timestamp": 5,
+}
+
+# Data format code and data length per object id, used to walk BTHome V2 payloads.
+# Raw and string objects have a variable length (0 here), which is sent in the
+# byte following the object id.
+_V2_OBJECT_LAYOUTS: dict[int, tuple[int, int]] = {
+    obj_id: (
+        _DATA_FORMATS[meas_type.data_format],
+        0 if meas_type.data_format in ("raw", "string") else meas_type.data_length,
+    )
+    for obj_id, meas_type in MEAS_TYPES.items()
+}
+
+_MeasFormat = Union[EventDeviceKeys, BaseSensorDescription, BaseBinarySensorDescription]
+
+# Measurement type fields as lookup tables indexed by object id,
+# unknown object ids have no measurement format
+_MEAS_FORMATS: tuple[_MeasFormat | None, ...] = tuple(
+    MEAS_TYPES[obj_id].meas_format if obj_id in MEAS_TYPES else None
+    for obj_id in range(256)
+)
+_MEAS_FACTORS: tuple[int | float, ...] = tuple(
+    MEAS_TYPES[obj_id].factor if obj_id in MEAS_TYPES else 1.0 for obj_id in range(256)
+)
+_MEAS_DECIMALS: tuple[int, ...] = tuple(
+    MEAS_TYPES[obj_id].decimals if obj_id in MEAS_TYPES else 0 for obj_id in range(256)
+)
+
+
+class _PayloadLayout:
+    """Object layout of a BTHome V2 payload with fixed length objects only."""
+
+    def __init__(
+        self,
+        payload_length: int,
+        obj_id_positions: tuple[int, ...],
+        objects: tuple[tuple[int, int, int, int], ...],
+        payload: bytes,
+    ) -> None:
+        self.payload_length = payload_length
+        self.objects = objects
+        self._get_obj_ids = itemgetter(*obj_id_positions)
+        self._obj_ids = self._get_obj_ids(payload)
+
+    def matches(self, payload: bytes) -> bool:
+        """Return True if the payload has the same object ids at the same positions.
+
+        As the length of each object follows from its object id, this means the
+        payload has the same layout.
+        """
+        return (
+            len(payload) == self.payload_length
+            and self._get_obj_ids(payload) == self._obj_ids
+        )
+
 
 class EncryptionScheme(Enum):
     # No encryption is needed to use this device
@@ -45,35 +132,36 @@ def to_mac(addr: bytes) -> str:
     return ":".join(f"{i:02X}" for i in addr)
 
 
-def parse_uint(data_obj: bytes, factor: float = 1.0) -> float:
+def parse_uint(
+    data_obj: bytes, factor: float = 1.0, decimals: int | None = None
+) -> float:
     """Convert bytes (as unsigned integer) and factor to float."""
-    decimal_places = -int(f"{factor:e}".split("e")[-1])
-    return round(
-        int.from_bytes(data_obj, "little", signed=False) * factor, decimal_places
-    )
+    if decimals is None:
+        decimals = decimal_places(factor)
+    return round(int.from_bytes(data_obj, "little", signed=False) * factor, decimals)
 
 
-def parse_int(data_obj: bytes, factor: float = 1.0) -> float:
+def parse_int(
+    data_obj: bytes, factor: float = 1.0, decimals: int | None = None
+) -> float:
     """Convert bytes (as signed integer) and factor to float."""
-    decimal_places = -int(f"{factor:e}".split("e")[-1])
-    return round(
-        int.from_bytes(data_obj, "little", signed=True) * factor, decimal_places
-    )
+    if decimals is None:
+        decimals = decimal_places(factor)
+    return round(int.from_bytes(data_obj, "little", signed=True) * factor, decimals)
 
 
-def parse_float(data_obj: bytes, factor: float = 1.0) -> float | None:
+def parse_float(
+    data_obj: bytes, factor: float = 1.0, decimals: int | None = None
+) -> float | None:
     """Convert bytes (as float) and factor to float."""
-    decimal_places = -int(f"{factor:e}".split("e")[-1])
-    if len(data_obj) == 2:
-        [val] = struct.unpack("e", data_obj)
-    elif len(data_obj) == 4:
-        [val] = struct.unpack("f", data_obj)
-    elif len(data_obj) == 8:
-        [val] = struct.unpack("d", data_obj)
-    else:
+    if decimals is None:
+        decimals = decimal_places(factor)
+    unpacker = _FLOAT_STRUCTS.get(len(data_obj))
+    if unpacker is None:
         _LOGGER.error("only 2, 4 or 8 byte long floats are supported in BTHome BLE")
         return None
-    return round(val * factor, decimal_places)
+    [val] = unpacker.unpack(data_obj)
+    return round(val * factor, decimals)
 
 
 def parse_raw(data_obj: bytes) -> str | None:
@@ -101,7 +189,20 @@ def parse_timestamp(data_obj: bytes) -> datetime:
     return value
 
 
-def parse_event_type(event_device: str, data_obj: int) -> str | None:
+# Parsers indexed by data format code (0-2 use a factor, 3-5 don't)
+_NUMBER_PARSERS: tuple[Callable[[bytes, float, int], float | None], ...] = (
+    parse_uint,
+    parse_int,
+    parse_float,
+)
+_DATA_PARSERS: tuple[Callable[[bytes], str | datetime | None], ...] = (
+    parse_string,
+    parse_raw,
+    parse_timestamp,
+)
+
+
+def parse_event_type(event_device: EventDeviceKeys, data_obj: int) -> str | None:
     """Convert bytes to event type."""
     if event_device == "dimmer":
         event_type = DIMMER_EVENTS.get(data_obj)
@@ -113,7 +214,7 @@ def parse_event_type(event_device: str, data_obj: int) -> str | None:
 
 
 def parse_event_properties(
-    event_device: str, data_obj: bytes
+    event_device: EventDeviceKeys, data_obj: bytes
 ) -> dict[str, str | int | float | None] | None:
     """Convert bytes to event properties."""
     if event_device == "dimmer":
@@ -128,6 +229,9 @@ class BTHomeBluetoothDeviceData(BluetoothData):
 
     def __init__(self, bindkey: bytes | None = None) -> None:
         super().__init__()
+        self.bindkey: bytes | None = None
+        self.cipher: AESCCM | None = None
+        self._bindkey_valid = False
         self.set_bindkey(bindkey)
 
         # Data that we know how to parse but don't yet map to the SensorData model.
@@ -166,14 +270,52 @@ class BTHomeBluetoothDeviceData(BluetoothData):
         # If this is True, the device is not sending advertisements in a regular interval
         self.sleepy_device = False
 
+        # Identifier, ATC identifier and MAC bytes of each address seen
+        self._address_cache: dict[str, tuple[str, str, bytes | None]] = {}
+
+        # The device information that has been set last, to skip setting it again
+        self._device_info_key: tuple[int, str, str] | None = None
+        self._device_sw_version: str | None = None
+
+        # The object layout of the last BTHome V2 payload, if it can be reused
+        self._payload_layout: _PayloadLayout | None = None
+
     def set_bindkey(self, bindkey: bytes | None) -> None:
         """Set the bindkey."""
+        if bindkey == self.bindkey:
+            # Keep the cipher (and its key schedule) of an unchanged bindkey
+            return
         self.bindkey = bindkey
+        self._bindkey_valid = bindkey is not None and len(bindkey) == 16
         if bindkey:
-            self.cipher: AESCCM | None = AESCCM(bindkey, tag_length=4)
+            self.cipher = AESCCM(bindkey, tag_length=4)
         else:
             self.cipher = None
 
+    def _parse_address(self, address: str) -> tuple[str, str, bytes | None]:
+        """Return the identifier, ATC identifier and MAC bytes of an address.
+
+        The MAC bytes are None if the address is not a MAC address (e.g. the UUID
+        used on macOS). The result is cached, as a device keeps advertising with
+        the same address.
+        """
+        address_info = self._address_cache.get(address)
+        if address_info is None:
+            address_hex = address.translate(_ADDRESS_SEPARATORS)
+            if len(address) != 17 or address[2] != ":":
+                mac = None
+            else:
+                mac = bytes.fromhex(address_hex)
+            address_info = (short_address(address), address_hex[-6:].upper(), mac)
+            self._address_cache[address] = address_info
+        return address_info
+
+    def _set_device_sw_version(self, sw_version: str) -> None:
+        """Set the device software version, if it has changed."""
+        if sw_version != self._device_sw_version:
+            self._device_sw_version = sw_version
+            self.set_device_sw_version(sw_version)
+
     def supported(self, data: BluetoothServiceInfoBleak) -> bool:
         if not super().supported(data):
             return False
@@ -183,69 +325,69 @@ class BTHomeBluetoothDeviceData(BluetoothData):
         """Update from BLE advertisement data."""
         _LOGGER.debug("Parsing BTHome BLE advertisement data: %s", service_info)
         for uuid, service_data in service_info.service_data.items():
-            if uuid in [
-                "0000181c-0000-1000-8000-00805f9b34fb",
-                "0000181e-0000-1000-8000-00805f9b34fb",
-            ]:
-                if self._parse_bthome_v1(service_info, service_data):
-                    self.last_service_info = service_info
-            elif uuid == "0000fcd2-0000-1000-8000-00805f9b34fb":
+            if uuid == _SERVICE_UUID_V2:
                 if self._parse_bthome_v2(service_info, service_data):
                     self.last_service_info = service_info
+            elif uuid == _SERVICE_UUID_V1 or uuid == _SERVICE_UUID_V1_ENCRYPTED:
+                if self._parse_bthome_v1(
+                    service_info, service_data, uuid == _SERVICE_UUID_V1_ENCRYPTED
+                ):
+                    self.last_service_info = service_info
         return None
 
     def _parse_bthome_v1(
-        self, service_info: BluetoothServiceInfoBleak, service_data: bytes
+        self,
+        service_info: BluetoothServiceInfoBleak,
+        service_data: bytes,
+        encrypted: bool,
     ) -> bool:
         """Parser for BTHome sensors version V1"""
-        identifier = short_address(service_info.address)
-        name = service_info.name
+        identifier, atc_identifier, source_mac = self._parse_address(
+            service_info.address
+        )
         sw_version = 1
 
-        # Remove identifier from ATC sensors.
-        atc_identifier = (
-            service_info.address.replace("-", "").replace(":", "")[-6:].upper()
-        )
-        if name[-6:] == atc_identifier:
-            name = name[:-6].rstrip(" _")
-
-        # Try to get manufacturer
-        if name.startswith(("ATC", "LYWSD03MMC")):
-            manufacturer = "Xiaomi"
-        elif name.startswith("prst"):
-            manufacturer = "b-parasite"
-            name = "b-parasite"
-        else:
-            manufacturer = None
+        # Device information only changes with the name or address
+        device_info_key = (sw_version, service_info.name, service_info.address)
+        if device_info_key != self._device_info_key:
+            self._device_info_key = device_info_key
+            name = service_info.name
+
+            # Remove identifier from ATC sensors.
+            if name[-6:] == atc_identifier:
+                name = name[:-6].rstrip(" _")
+
+            # Try to get manufacturer
+            if name.startswith(("ATC", "LYWSD03MMC")):
+                manufacturer = "Xiaomi"
+            elif name.startswith("prst"):
+                manufacturer = "b-parasite"
+                name = "b-parasite"
+            else:
+                manufacturer = None
 
-        if manufacturer:
-            self.set_device_manufacturer(manufacturer)
+            if manufacturer:
+                self.set_device_manufacturer(manufacturer)
 
-        self.set_device_name(f"{name} {identifier}")
-        self.set_title(f"{name} {identifier}")
-        self.set_device_type("BTHome sensor")
+            self.set_device_name(f"{name} {identifier}")
+            self.set_title(f"{name} {identifier}")
+            self.set_device_type("BTHome sensor")
 
-        uuid16 = list(service_info.service_data.keys())
-        if "0000181c-0000-1000-8000-00805f9b34fb" in uuid16:
+        if not encrypted:
             # Non-encrypted BTHome BLE format
             self.encryption_scheme = EncryptionScheme.NONE
-            self.set_device_sw_version("BTHome BLE v1")
+            self._set_device_sw_version("BTHome BLE v1")
             payload = service_data
-        elif "0000181e-0000-1000-8000-00805f9b34fb" in uuid16:
+        else:
             # Encrypted BTHome BLE format
             self.encryption_scheme = EncryptionScheme.BTHOME_BINDKEY
-            self.set_device_sw_version("BTHome BLE v1 (encrypted)")
-            mac_readable = service_info.address
-            source_mac = bytes.fromhex(mac_readable.replace(":", ""))
-
+            self._set_device_sw_version("BTHome BLE v1 (encrypted)")
             try:
                 payload = self._decrypt_bthome(
                     service_info, service_data, source_mac, sw_version
                 )
             except (ValueError, TypeError):
                 return True
-        else:
-            return False
 
         return self._parse_payload(payload, sw_version, service_info.time)
 
@@ -253,19 +395,9 @@ class BTHomeBluetoothDeviceData(BluetoothData):
         self, service_info: BluetoothServiceInfoBleak, service_data: bytes
     ) -> bool:
         """Parser for BTHome sensors version V2"""
-        identifier = short_address(service_info.address)
-        name = service_info.name
-
-        if name == service_info.address:
-            name = "BTHome sensor"
-
-        # Remove identifier from ATC sensors name.
-        atc_identifier = (
-            service_info.address.replace("-", "").replace(":", "")[-6:].upper()
+        identifier, atc_identifier, bthome_mac = self._parse_address(
+            service_info.address
         )
-        if name[-6:] == atc_identifier:
-            name = name[:-6].rstrip(" _")
-
         adv_info = service_data[0]
 
         # Determine if encryption is used
@@ -278,11 +410,10 @@ class BTHomeBluetoothDeviceData(BluetoothData):
         # If True, the first 6 bytes contain the mac address
         mac_included = adv_info & (1 << 1)  # bit 1
         if mac_included:
-            bthome_mac_reversed = service_data[1:7]
-            mac_readable = to_mac(bthome_mac_reversed[::-1])
+            # The MAC address is included in reversed byte order
+            bthome_mac = service_data[6:0:-1]
             payload = service_data[7:]
         else:
-            mac_readable = service_info.address
             payload = service_data[1:]
 
         # If True, the device is only updating when triggered
@@ -292,9 +423,9 @@ class BTHomeBluetoothDeviceData(BluetoothData):
         sw_version = (adv_info >> 5) & 7  # 3 bits (5-7)
         if sw_version == 2:
             if self.encryption_scheme == EncryptionScheme.BTHOME_BINDKEY:
-                self.set_device_sw_version(f"BTHome BLE v{sw_version} (encrypted)")
+                self._set_device_sw_version("BTHome BLE v2 (encrypted)")
             else:
-                self.set_device_sw_version(f"BTHome BLE v{sw_version}")
+                self._set_device_sw_version("BTHome BLE v2")
         else:
             _LOGGER.error(
                 "%s: Sensor is set to use BTHome version %s, which is not existing. "
@@ -304,36 +435,48 @@ class BTHomeBluetoothDeviceData(BluetoothData):
             )
             return False
 
-        # Try to get manufacturer based on the name
-        if name.startswith(("ATC", "LYWSD03MMC")):
-            manufacturer = "Xiaomi"
-            device_type = "Temperature/Humidity sensor"
-        elif name.startswith("prst"):
-            manufacturer = "b-parasite"
-            name = "b-parasite"
-            device_type = "Plant sensor"
-        elif name.startswith("SBBT"):
-            manufacturer = "Shelly"
-            name = "Shelly BLU Button1"
-            device_type = "BLU Button1"
-        elif name.startswith("SBDW"):
-            manufacturer = "Shelly"
-            name = "Shelly BLU Door/Window"
-            device_type = "BLU Door/Window"
-        else:
-            manufacturer = None
-            device_type = "BTHome sensor"
+        # Device information only changes with the name or address
+        device_info_key = (sw_version, service_info.name, service_info.address)
+        if device_info_key != self._device_info_key:
+            self._device_info_key = device_info_key
+            name = service_info.name
+
+            if name == service_info.address:
+                name = "BTHome sensor"
+
+            # Remove identifier from ATC sensors name.
+            if name[-6:] == atc_identifier:
+                name = name[:-6].rstrip(" _")
+
+            # Try to get manufacturer based on the name
+            if name.startswith(("ATC", "LYWSD03MMC")):
+                manufacturer = "Xiaomi"
+                device_type = "Temperature/Humidity sensor"
+            elif name.startswith("prst"):
+                manufacturer = "b-parasite"
+                name = "b-parasite"
+                device_type = "Plant sensor"
+            elif name.startswith("SBBT"):
+                manufacturer = "Shelly"
+                name = "Shelly BLU Button1"
+                device_type = "BLU Button1"
+            elif name.startswith("SBDW"):
+                manufacturer = "Shelly"
+                name = "Shelly BLU Door/Window"
+                device_type = "BLU Door/Window"
+            else:
+                manufacturer = None
+                device_type = "BTHome sensor"
 
-        if manufacturer:
-            self.set_device_manufacturer(manufacturer)
+            if manufacturer:
+                self.set_device_manufacturer(manufacturer)
 
-        # Get device information from local name and identifier
-        self.set_device_name(f"{name} {identifier}")
-        self.set_title(f"{name} {identifier}")
-        self.set_device_type(device_type)
+            # Get device information from local name and identifier
+            self.set_device_name(f"{name} {identifier}")
+            self.set_title(f"{name} {identifier}")
+            self.set_device_type(device_type)
 
         if self.encryption_scheme == EncryptionScheme.BTHOME_BINDKEY:
-            bthome_mac = bytes.fromhex(mac_readable.replace(":", ""))
             # Decode encrypted payload
             try:
                 payload = self._decrypt_bthome(
@@ -395,14 +538,24 @@ class BTHomeBluetoothDeviceData(BluetoothData):
         )
         return True
 
-    def _parse_payload(self, payload: bytes, sw_version: int, adv_time: float) -> bool:
+    def _split_payload(
+        self, payload: bytes, sw_version: int
+    ) -> tuple[tuple[int, int, int, int], ...]:
+        """Split a payload into (data format, object id, data start, data end) objects.
+
+        The layout of a BTHome V2 payload with fixed length objects only is cached,
+        as a device normally sends the same objects in every advertisement.
+        """
+        layout = self._payload_layout
+        if sw_version == 2 and layout is not None and layout.matches(payload):
+            return layout.objects
+
         payload_length = len(payload)
         next_obj_start = 0
         prev_obj_meas_type = 0
-        result = False
-        measurements: list[dict[str, Any]] = []
-        postfix_dict: dict[str, int] = {}
-        obj_data_format: str | int
+        objects: list[tuple[int, int, int, int]] = []
+        obj_id_positions: list[int] = []
+        cacheable = sw_version == 2
 
         # Create a list with all individual objects
         while payload_length >= next_obj_start + 1:
@@ -420,6 +573,7 @@ class BTHomeBluetoothDeviceData(BluetoothData):
                 # BTHome V2
                 obj_meas_type = payload[obj_start]
                 if prev_obj_meas_type > obj_meas_type:
+                    cacheable = False
                     _LOGGER.warning(
                         "%s: BTHome device is not sending object ids in numerical order (from low "
                         "to high object id). This can cause issues with your BTHome receiver, "
@@ -427,84 +581,103 @@ class BTHomeBluetoothDeviceData(BluetoothData):
                         self.title,
                         payload.hex(),
                     )
-                if obj_meas_type not in MEAS_TYPES:
-                    _LOGGER.debug(
-                        "%s: Invalid Object ID found in payload: %s",
-                        self.title,
-                        payload.hex(),
-                    )
+                obj_layout = _V2_OBJECT_LAYOUTS.get(obj_meas_type)
+                if obj_layout is None:
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "%s: Invalid Object ID found in payload: %s",
+                            self.title,
+                            payload.hex(),
+                        )
+                    cacheable = False
                     break
                 prev_obj_meas_type = obj_meas_type
-                obj_data_format = MEAS_TYPES[obj_meas_type].data_format
+                obj_data_format, obj_fixed_length = obj_layout
 
-                if obj_data_format in ["raw", "string"]:
+                if obj_fixed_length:
+                    obj_data_length = obj_fixed_length
+                    obj_data_start = obj_start + 1
+                else:
+                    cacheable = False
                     obj_data_length = payload[obj_start + 1]
                     obj_data_start = obj_start + 2
-                else:
-                    obj_data_length = MEAS_TYPES[obj_meas_type].data_length
-                    obj_data_start = obj_start + 1
                 next_obj_start = obj_data_start + obj_data_length
 
             if obj_data_length == 0:
-                _LOGGER.debug(
-                    "%s: Invalid payload data length found with length 0, payload: %s",
-                    self.title,
-                    payload.hex(),
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "%s: Invalid payload data length found with length 0, payload: %s",
+                        self.title,
+                        payload.hex(),
+                    )
                 continue
 
             if payload_length < next_obj_start:
-                _LOGGER.debug(
-                    "%s: Invalid payload data length, payload: %s",
-                    self.title,
-                    payload.hex(),
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "%s: Invalid payload data length, payload: %s",
+                        self.title,
+                        payload.hex(),
+                    )
+                cacheable = False
                 break
 
+            objects.append(
+                (obj_data_format, obj_meas_type, obj_data_start, next_obj_start)
+            )
+            obj_id_positions.append(obj_start)
+
+        if cacheable and obj_id_positions:
+            self._payload_layout = _PayloadLayout(
+                payload_length, tuple(obj_id_positions), tuple(objects), payload
+            )
+        return tuple(objects)
+
+    def _parse_payload(self, payload: bytes, sw_version: int, adv_time: float) -> bool:
+        result = False
+        measurements: list[tuple[int, int, bytes]] = []
+        seen_meas_formats: set[_MeasFormat] = set()
+        dup_meas_formats: set[_MeasFormat] = set()
+        postfix_dict: dict[_MeasFormat, int] = {}
+
+        objects = self._split_payload(payload, sw_version)
+        for obj_data_format, obj_meas_type, obj_data_start, obj_data_end in objects:
+            obj_data = payload[obj_data_start:obj_data_end]
+
             # Filter BLE advertisements with packet_id that has already been parsed.
             if obj_meas_type == 0:
-                new_packet_id = parse_uint(payload[obj_data_start:next_obj_start])
+                new_packet_id = parse_uint(obj_data, 1.0, 0)
                 if self._skip_old_or_duplicated_advertisement(new_packet_id, adv_time):
                     break
                 self.packet_id = new_packet_id
 
-            measurements.append(
-                {
-                    "data format": obj_data_format,
-                    "data length": obj_data_length,
-                    "measurement type": obj_meas_type,
-                    "measurement data": payload[obj_data_start:next_obj_start],
-                    "device id": None,
-                }
-            )
+            measurements.append((obj_data_format, obj_meas_type, obj_data))
 
-        # Get a list of measurement types that are included more than once.
-        seen_meas_formats = set()
-        dup_meas_formats = set()
-        for meas in measurements:
-            if meas["measurement type"] in MEAS_TYPES:
-                meas_format = MEAS_TYPES[meas["measurement type"]].meas_format
+            # Keep track of measurement types that are included more than once.
+            meas_format = _MEAS_FORMATS[obj_meas_type]
+            if meas_format is not None:
                 if meas_format in seen_meas_formats:
                     dup_meas_formats.add(meas_format)
                 else:
                     seen_meas_formats.add(meas_format)
 
         # Parse each object into readable information
-        for meas in measurements:
-            if meas["measurement type"] not in MEAS_TYPES:
-                _LOGGER.debug(
-                    "%s: UNKNOWN measurement type %s in BTHome BLE payload! Adv: %s",
-                    self.title,
-                    meas["measurement type"],
-                    payload.hex(),
-                )
+        for data_format, obj_meas_type, obj_data in measurements:
+            meas_format = _MEAS_FORMATS[obj_meas_type]
+            if meas_format is None:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "%s: UNKNOWN measurement type %s in BTHome BLE payload! Adv: %s",
+                        self.title,
+                        obj_meas_type,
+                        payload.hex(),
+                    )
                 continue
 
-            meas_type = MEAS_TYPES[meas["measurement type"]]
-            meas_format = meas_type.meas_format
-            meas_factor = meas_type.factor
+            meas_factor = _MEAS_FACTORS[obj_meas_type]
+            meas_decimals = _MEAS_DECIMALS[obj_meas_type]
 
-            if meas_type.meas_format in dup_meas_formats:
+            if meas_format in dup_meas_formats:
                 # Add a postfix for advertisements with multiple measurements of the same type
                 postfix_counter = postfix_dict.get(meas_format, 0) + 1
                 postfix_dict[meas_format] = postfix_counter
@@ -513,18 +686,12 @@ class BTHomeBluetoothDeviceData(BluetoothData):
                 postfix = ""
 
             value: None | str | int | float | datetime
-            if meas["data format"] == 0 or meas["data format"] == "unsigned_integer":
-                value = parse_uint(meas["measurement data"], meas_factor)
-            elif meas["data format"] == 1 or meas["data format"] == "signed_integer":
-                value = parse_int(meas["measurement data"], meas_factor)
-            elif meas["data format"] == 2 or meas["data format"] == "float":
-                value = parse_float(meas["measurement data"], meas_factor)
-            elif meas["data format"] == 3 or meas["data format"] == "string":
-                value = parse_string(meas["measurement data"])
-            elif meas["data format"] == 4 or meas["data format"] == "raw":
-                value = parse_raw(meas["measurement data"])
-            elif meas["data format"] == 5 or meas["data format"] == "timestamp":
-                value = parse_timestamp(meas["measurement data"])
+            if data_format < 3:
+                value = _NUMBER_PARSERS[data_format](
+                    obj_data, meas_factor, meas_decimals
+                )
+            elif data_format < 6:
+                value = _DATA_PARSERS[data_format - 3](obj_data)
             else:
                 _LOGGER.error(
                     "%s: UNKNOWN dataobject in BTHome BLE payload! Adv: %s",
@@ -556,11 +723,11 @@ class BTHomeBluetoothDeviceData(BluetoothData):
                 elif isinstance(meas_format, EventDeviceKeys):
                     event_type = parse_event_type(
                         event_device=meas_format,
-                        data_obj=meas["measurement data"][0],
+                        data_obj=obj_data[0],
                     )
                     event_properties = parse_event_properties(
                         event_device=meas_format,
-                        data_obj=meas["measurement data"][1:],
+                        data_obj=obj_data[1:],
                     )
                     if event_type:
                         self.fire_event(
@@ -569,7 +736,7 @@ class BTHomeBluetoothDeviceData(BluetoothData):
                             event_properties=event_properties,
                         )
                 result = True
-            else:
+            elif _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(
                     "%s: UNKNOWN dataobject in BTHome BLE payload! Adv: %s",
                     self.title,
@@ -585,49 +752,59 @@ class BTHomeBluetoothDeviceData(BluetoothData):
         self,
         service_info: BluetoothServiceInfoBleak,
         service_data: bytes,
-        bthome_mac: bytes,
+        bthome_mac: bytes | None,
         sw_version: int,
         adv_info: int = 65,
     ) -> bytes:
         """Decrypt encrypted BTHome BLE advertisements"""
-        if not self.bindkey:
+        if not self._bindkey_valid:
             self.bindkey_verified = False
-            _LOGGER.debug("%s: Encryption key not set and adv is encrypted", self.title)
+            if not self.bindkey:
+                _LOGGER.debug(
+                    "%s: Encryption key not set and adv is encrypted", self.title
+                )
+            else:
+                _LOGGER.error(
+                    "%s: Encryption key should be 16 bytes (32 characters) long",
+                    self.title,
+                )
             raise ValueError
 
-        if not self.bindkey or len(self.bindkey) != 16:
+        if bthome_mac is None:
             self.bindkey_verified = False
-            _LOGGER.error(
-                "%s: Encryption key should be 16 bytes (32 characters) long", self.title
+            _LOGGER.debug(
+                "%s: MAC address of the device is unknown, which is needed for decryption",
+                self.title,
             )
             raise ValueError
 
         # check for minimum length of encrypted advertisement
         if len(service_data) < (12 if sw_version == 1 else 11):
-            _LOGGER.debug(
-                "%s: Invalid data length (for decryption), adv: %s",
-                self.title,
-                service_data.hex(),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Invalid data length (for decryption), adv: %s",
+                    self.title,
+                    service_data.hex(),
+                )
             raise ValueError
 
         # prepare the data for decryption
         if sw_version == 1:
-            uuid = b"\x1e\x18"
+            uuid = _BTHOME_V1_UUID
         else:
-            uuid = b"\xd2\xfc" + bytes([adv_info])
+            uuid = _BTHOME_V2_UUIDS[adv_info]
         encrypted_payload = service_data[:-8]
         last_encryption_counter = self.encryption_counter
         counter = service_data[-8:-4]
-        new_encryption_counter = parse_uint(counter)
+        new_encryption_counter = parse_uint(counter, 1.0, 0)
         mic = service_data[-4:]
 
         # nonce: mac [6], uuid16 [2 (v1) or 3 (v2)], counter [4]
-        nonce = b"".join([bthome_mac, uuid, counter])
+        nonce = bthome_mac + uuid + counter
 
         associated_data = None
         if sw_version == 1:
-            associated_data = b"\x11"
+            associated_data = _BTHOME_V1_ASSOCIATED_DATA
 
         assert self.cipher is not None  # nosec
 
@@ -674,11 +851,12 @@ class BTHomeBluetoothDeviceData(BluetoothData):
             else:
                 self.decryption_failed = True
             _LOGGER.warning("%s: Decryption failed: %s", self.title, error)
-            _LOGGER.debug("%s: mic: %s", self.title, mic.hex())
-            _LOGGER.debug("%s: nonce: %s", self.title, nonce.hex())
-            _LOGGER.debug(
-                "%s: encrypted_payload: %s", self.title, encrypted_payload.hex()
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("%s: mic: %s", self.title, mic.hex())
+                _LOGGER.debug("%s: nonce: %s", self.title, nonce.hex())
+                _LOGGER.debug(
+                    "%s: encrypted_payload: %s", self.title, encrypted_payload.hex()
+                )
             raise ValueError
         if decrypted_payload is None:
             self.bindkey_verified = False
@@ -229,6 +229,26 @@ def test_bindkey_correct():
     )
 
 
+def test_bindkey_without_mac_address(caplog):
+    """Test BTHome parser with an encrypted adv from a device without MAC address."""
+    bindkey = "231d39c1d7cc1ab1aee224cd096db932"
+    data_string = b'\xfb\xa45\xe4\xd3\xc3\x12\xfb\x00\x11"3W\xd9\n\x99'
+    advertisement = bytes_to_encrypted_service_info(
+        data_string,
+        local_name="TEST DEVICE",
+        address="DA5D3A87-7A2A-4E5B-A0BC-1A6D0AAB80A5",
+    )
+
+    device = BTHomeBluetoothDeviceData(bindkey=bytes.fromhex(bindkey))
+    assert device.supported(advertisement)
+    assert device.encryption_scheme == EncryptionScheme.BTHOME_BINDKEY
+    assert not device.bindkey_verified
+    assert (
+        "TEST DEVICE 80A5: MAC address of the device is unknown, which is needed for "
+        "decryption" in caplog.text
+    )
+
+
 def test_bindkey_verified_can_be_unset():
     """Test BTHome parser with wrong encryption key."""
     bindkey = "814aac74c4f17b6c1581e1ab87816b99"
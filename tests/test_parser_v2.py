@@ -20,7 +20,13 @@ from sensor_state_data import (
 )
 
 from bthome_ble.const import ExtendedSensorDeviceClass
-from bthome_ble.parser import BTHomeBluetoothDeviceData, EncryptionScheme
+from bthome_ble.parser import (
+    BTHomeBluetoothDeviceData,
+    EncryptionScheme,
+    parse_float,
+    parse_int,
+    parse_uint,
+)
 
 ADVERTISEMENT_TIME = 1709331995.5181565
 
@@ -104,6 +110,14 @@ def test_can_create():
     BTHomeBluetoothDeviceData()
 
 
+def test_parse_number_decimals_from_factor():
+    """Test that the number parsers round to the decimals of the factor by default."""
+    assert parse_uint(b"\x05", 0.1) == 0.5
+    assert parse_int(b"\xfb", 0.01) == -0.05
+    assert parse_float(b"\x00\x00\x00\x40", 0.1) == 0.2
+    assert parse_uint(b"\x05", 0.1, 0) == 0
+
+
 def test_encryption_key_needed():
     """Test that we can detect that an encryption key is needed."""
     data_string = (
@@ -217,6 +231,58 @@ def test_mac_as_name():
     )
 
 
+def test_device_info_changes():
+    """Test that the device information follows the latest advertisement."""
+    device = BTHomeBluetoothDeviceData()
+
+    advertisement = bytes_to_service_info(
+        b"\x40\x02\xca\x09",
+        local_name="TEST DEVICE",
+        address="A4:C1:38:8D:18:B2",
+    )
+    update = device.update(advertisement)
+    assert update.title == "TEST DEVICE 18B2"
+    assert update.devices[None] == SensorDeviceInfo(
+        name="TEST DEVICE 18B2",
+        manufacturer=None,
+        model="BTHome sensor",
+        sw_version="BTHome BLE v2",
+        hw_version=None,
+    )
+
+    advertisement = bytes_to_service_info(
+        b"\x40\x02\xca\x09",
+        local_name="SBBT-002C",
+        address="A4:C1:38:8D:18:B2",
+    )
+    update = device.update(advertisement)
+    assert update.title == "Shelly BLU Button1 18B2"
+    assert update.devices[None] == SensorDeviceInfo(
+        name="Shelly BLU Button1 18B2",
+        manufacturer="Shelly",
+        model="BLU Button1",
+        sw_version="BTHome BLE v2",
+        hw_version=None,
+    )
+
+    # Encrypted advertisement, without a bindkey
+    advertisement = bytes_to_service_info(
+        b"\x41\xa4\x72\x66\xc9\x5f\x73\x00\x11\x22\x33\x78\x23\x72\x14",
+        local_name="SBBT-002C",
+        address="A4:C1:38:8D:18:B2",
+    )
+    update = device.update(advertisement)
+    assert update.devices[None].sw_version == "BTHome BLE v2 (encrypted)"
+
+    advertisement = bytes_to_service_info(
+        b"\x40\x02\xca\x09",
+        local_name="SBBT-002C",
+        address="A4:C1:38:8D:18:B2",
+    )
+    update = device.update(advertisement)
+    assert update.devices[None].sw_version == "BTHome BLE v2"
+
+
 def test_has_incorrect_version():
     """Test that we can detect a non-existing version v7."""
     data_string = b"\xE1\x02\x00\x0c\x04\x04\x13\x8a\x01"
@@ -329,6 +395,25 @@ def test_bindkey_correct():
     )
 
 
+def test_bindkey_without_mac_address(caplog):
+    """Test BTHome parser with an encrypted adv from a device without MAC address."""
+    bindkey = "231d39c1d7cc1ab1aee224cd096db932"
+    data_string = b"\x41\xa4\x72\x66\xc9\x5f\x73\x00\x11\x22\x33\x78\x23\x72\x14"
+    advertisement = bytes_to_service_info(
+        data_string,
+        local_name="TEST DEVICE",
+        address="DA5D3A87-7A2A-4E5B-A0BC-1A6D0AAB80A5",
+    )
+
+    device = BTHomeBluetoothDeviceData(bindkey=bytes.fromhex(bindkey))
+    assert device.supported(advertisement)
+    assert not device.bindkey_verified
+    assert (
+        "TEST DEVICE 80A5: MAC address of the device is unknown, which is needed for "
+        "decryption" in caplog.text
+    )
+
+
 def test_incorrect_bindkey_length(caplog):
     """Test BTHome parser with incorrect encryption key length."""
     bindkey = (
@@ -1257,6 +1342,18 @@ def test_bthome_count(caplog):
     )
 
 
+def test_bthome_count_is_int(caplog):
+    """Test BTHome parser returns an int for measurements with a factor of 1."""
+    advertisement = bytes_to_service_info(
+        b"\x40\x09\x05", local_name="TEST DEVICE", address="A4:C1:38:8D:18:B2"
+    )
+
+    device = BTHomeBluetoothDeviceData()
+    native_value = device.update(advertisement).entity_values[KEY_COUNT].native_value
+    assert native_value == 5
+    assert type(native_value) is int
+
+
 def test_bthome_energy(caplog):
     """Test BTHome parser for energy reading without encryption."""
     data_string = b"\x40\x0a\x13\x8a\x14"
@@ -2277,6 +2374,49 @@ def test_bthome_temperature_2(caplog):
     )
 
 
+def test_bthome_temperature_zero(caplog):
+    """Test BTHome parser for a temperature of zero degrees."""
+    data_string = b"\x40\x02\x00\x00"
+    advertisement = bytes_to_service_info(
+        data_string, local_name="TEST DEVICE", address="A4:C1:38:8D:18:B2"
+    )
+
+    device = BTHomeBluetoothDeviceData()
+
+    assert device.update(advertisement) == SensorUpdate(
+        title="TEST DEVICE 18B2",
+        devices={
+            None: SensorDeviceInfo(
+                name="TEST DEVICE 18B2",
+                manufacturer=None,
+                model="BTHome sensor",
+                sw_version="BTHome BLE v2",
+                hw_version=None,
+            )
+        },
+        entity_descriptions={
+            KEY_TEMPERATURE: SensorDescription(
+                device_key=KEY_TEMPERATURE,
+                device_class=SensorDeviceClass.TEMPERATURE,
+                native_unit_of_measurement=Units.TEMP_CELSIUS,
+            ),
+            KEY_SIGNAL_STRENGTH: SensorDescription(
+                device_key=KEY_SIGNAL_STRENGTH,
+                device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+                native_unit_of_measurement=Units.SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+            ),
+        },
+        entity_values={
+            KEY_TEMPERATURE: SensorValue(
+                device_key=KEY_TEMPERATURE, name="Temperature", native_value=0
+            ),
+            KEY_SIGNAL_STRENGTH: SensorValue(
+                device_key=KEY_SIGNAL_STRENGTH, name="Signal Strength", native_value=-60
+            ),
+        },
+    )
+
+
 def test_bthome_uv_index(caplog):
     """Test BTHome parser for UV index."""
     data_string = b"\x40\x46\x32"
@@ -3305,6 +3445,39 @@ def test_bthome_double_voltage_different_object_id(caplog):
     )
 
 
+def test_bthome_changing_object_layout(caplog):
+    """Test BTHome parser for a device that changes the objects it sends."""
+    device = BTHomeBluetoothDeviceData()
+
+    advertisement = bytes_to_service_info(
+        b"\x40\x02\xca\x09\x03\xbf\x13",
+        local_name="TEST DEVICE",
+        address="A4:C1:38:8D:18:B2",
+    )
+    entity_values = device.update(advertisement).entity_values
+    assert entity_values[KEY_TEMPERATURE].native_value == 25.06
+    assert entity_values[KEY_HUMIDITY].native_value == 50.55
+
+    # Same payload length and first object, but a different second object
+    advertisement = bytes_to_service_info(
+        b"\x40\x02\xcb\x09\x0c\x02\x0c",
+        local_name="TEST DEVICE",
+        address="A4:C1:38:8D:18:B2",
+    )
+    entity_values = device.update(advertisement).entity_values
+    assert entity_values[KEY_TEMPERATURE].native_value == 25.07
+    assert entity_values[KEY_VOLTAGE].native_value == 3.074
+
+    advertisement = bytes_to_service_info(
+        b"\x40\x02\xcc\x09\x03\xc0\x13",
+        local_name="TEST DEVICE",
+        address="A4:C1:38:8D:18:B2",
+    )
+    entity_values = device.update(advertisement).entity_values
+    assert entity_values[KEY_TEMPERATURE].native_value == 25.08
+    assert entity_values[KEY_HUMIDITY].native_value == 50.56
+
+
 def test_bthome_shelly_button(caplog):
     """
     Test BTHome parser with a shelly button.